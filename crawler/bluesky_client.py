@@ -1,45 +1,103 @@
 """
 Bluesky ATP client for fetching Der Spiegel posts.
 """
-import json
 import os
+import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+import orjson
 from atproto import Client
 
 # Der Spiegel's Bluesky handle
 SPIEGEL_HANDLE = "derspiegel.bsky.social"
 
-# File to track already fetched posts
+# Database tracking already fetched posts
+FETCHED_POSTS_DB = Path(__file__).parent / "fetched_posts.sqlite"
+
+# Legacy JSON file, imported into the database on first use
 FETCHED_POSTS_FILE = Path(__file__).parent / "fetched_posts.json"
 
+# Number of posts requested per author feed page
+PAGE_SIZE = 50
 
-def load_fetched_posts() -> set:
-    """Load set of already fetched post URIs."""
-    if FETCHED_POSTS_FILE.exists():
-        with open(FETCHED_POSTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return set(data.get("uris", []))
-    return set()
+# Shared client, so repeated fetches reuse its HTTP connection pool
+_client = None
 
 
-def save_fetched_posts(uris: set) -> None:
-    """Save set of fetched post URIs."""
-    with open(FETCHED_POSTS_FILE, "w", encoding="utf-8") as f:
-        json.dump({"uris": list(uris), "last_updated": datetime.now().isoformat()}, f)
+def _get_client() -> Client:
+    """Get or create the shared Bluesky client."""
+    global _client
+    if _client is None:
+        _client = Client()
+    return _client
 
 
-def fetch_spiegel_posts(limit: int = 50) -> list[dict]:
+def _connect() -> sqlite3.Connection:
+    """Open the fetched posts database, creating it if needed."""
+    is_new = not FETCHED_POSTS_DB.exists()
+    conn = sqlite3.connect(FETCHED_POSTS_DB)
+    conn.execute("CREATE TABLE IF NOT EXISTS posts (uri TEXT PRIMARY KEY, fetched_at TEXT)")
+
+    if is_new and FETCHED_POSTS_FILE.exists():
+        try:
+            with open(FETCHED_POSTS_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+            fetched_at = data.get("last_updated") or datetime.now().isoformat()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO posts (uri, fetched_at) VALUES (?, ?)",
+                    [(uri, fetched_at) for uri in data.get("uris", [])]
+                )
+        except Exception:
+            # Remove the half-initialized database so the import is retried,
+            # instead of treating every previously fetched post as new
+            conn.close()
+            FETCHED_POSTS_DB.unlink(missing_ok=True)
+            raise
+    return conn
+
+
+def _filter_fetched(conn: sqlite3.Connection, uris: list[str]) -> set:
+    """Return the subset of URIs that have already been fetched."""
+    if not uris:
+        return set()
+    placeholders = ", ".join("?" * len(uris))
+    rows = conn.execute(f"SELECT uri FROM posts WHERE uri IN ({placeholders})", uris)
+    return {row[0] for row in rows}
+
+
+def save_fetched_posts(uris: list[str]) -> None:
+    """Record newly fetched post URIs."""
+    if not uris:
+        return
+    fetched_at = datetime.now().isoformat()
+    conn = _connect()
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO posts (uri, fetched_at) VALUES (?, ?)",
+                [(uri, fetched_at) for uri in uris]
+            )
+    finally:
+        conn.close()
+
+
+def iter_spiegel_posts(limit: int = 50) -> Iterator[dict]:
     """
-    Fetch posts from Der Spiegel's Bluesky account.
+    Yield posts from Der Spiegel's Bluesky account as pagination proceeds.
+
+    Yielded posts are recorded as fetched once the generator finishes or
+    is closed.
 
     Args:
         limit: Maximum number of posts to fetch
 
-    Returns:
-        List of post dictionaries with text, created_at, and uri
+    Yields:
+        Post dictionaries with text, created_at, and uri
     """
-    client = Client()
+    client = _get_client()
 
     # Get the profile to resolve the DID
     try:
@@ -47,56 +105,94 @@ def fetch_spiegel_posts(limit: int = 50) -> list[dict]:
         did = profile.did
     except Exception as e:
         print(f"Error fetching profile for {SPIEGEL_HANDLE}: {e}")
-        return []
+        return
 
     # Fetch the author's feed
-    posts = []
-    fetched_uris = load_fetched_posts()
-    cursor = None
+    new_uris = []
+    fetched_uris = set()
+    conn = _connect()
 
-    while len(posts) < limit:
-        try:
-            response = client.get_author_feed(
-                actor=did,
-                limit=min(50, limit - len(posts)),
-                cursor=cursor
-            )
-        except Exception as e:
-            print(f"Error fetching feed: {e}")
-            break
+    def fetch_page(cursor):
+        return client.get_author_feed(actor=did, limit=PAGE_SIZE, cursor=cursor)
 
-        if not response.feed:
-            break
+    # Cursors are chained, so pages can't be requested out of order. Instead
+    # the next page is fetched in the background while the current one is
+    # processed, whenever the current page alone can't reach the limit.
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch_page, None)
+
+            while next_page is not None and len(new_uris) < limit:
+                try:
+                    response = next_page.result()
+                except Exception as e:
+                    print(f"Error fetching feed: {e}")
+                    break
+
+                if not response.feed:
+                    break
+
+                next_page = None
+                if response.cursor and len(new_uris) + len(response.feed) < limit:
+                    next_page = executor.submit(fetch_page, response.cursor)
+
+                fetched_uris.update(_filter_fetched(conn, [item.post.uri for item in response.feed]))
+
+                for feed_item in response.feed:
+                    if len(new_uris) >= limit:
+                        break
+
+                    post = feed_item.post
+                    post_uri = post.uri
+
+                    # Skip already fetched posts
+                    if post_uri in fetched_uris:
+                        continue
+
+                    # Extract post data
+                    record = post.record
+                    if hasattr(record, 'text') and record.text:
+                        post_data = {
+                            "uri": post_uri,
+                            "text": record.text,
+                            "created_at": record.created_at if hasattr(record, 'created_at') else None,
+                            "author": SPIEGEL_HANDLE,
+                            "cid": post.cid
+                        }
+                        new_uris.append(post_uri)
+                        fetched_uris.add(post_uri)
+                        yield post_data
+
+                if next_page is None and response.cursor and len(new_uris) < limit:
+                    next_page = executor.submit(fetch_page, response.cursor)
+    finally:
+        conn.close()
+
+        # Save newly fetched posts
+        save_fetched_posts(new_uris)
 
-        for feed_item in response.feed:
-            post = feed_item.post
-            post_uri = post.uri
 
-            # Skip already fetched posts
-            if post_uri in fetched_uris:
-                continue
+def fetch_spiegel_posts(limit: int = 50) -> list[dict]:
+    """
+    Fetch posts from Der Spiegel's Bluesky account.
 
-            # Extract post data
-            record = post.record
-            if hasattr(record, 'text') and record.text:
-                post_data = {
-                    "uri": post_uri,
-                    "text": record.text,
-                    "created_at": record.created_at if hasattr(record, 'created_at') else None,
-                    "author": SPIEGEL_HANDLE,
-                    "cid": post.cid
-                }
-                posts.append(post_data)
-                fetched_uris.add(post_uri)
+    Args:
+        limit: Maximum number of posts to fetch
 
-        cursor = response.cursor
-        if not cursor:
-            break
+    Returns:
+        List of post dictionaries with text, created_at, and uri
+    """
+    return list(iter_spiegel_posts(limit=limit))
 
-    # Save updated fetched posts
-    save_fetched_posts(fetched_uris)
 
-    return posts
+def iter_new_posts() -> Iterator[dict]:
+    """
+    Yield only new posts that haven't been processed yet.
+
+    Yields:
+        New post dictionaries
+    """
+    return iter_spiegel_posts(limit=100)
 
 
 def fetch_new_posts() -> list[dict]:
@@ -106,7 +202,7 @@ def fetch_new_posts() -> list[dict]:
     Returns:
         List of new post dictionaries
     """
-    return fetch_spiegel_posts(limit=100)
+    return list(iter_new_posts())
 
 
 if __name__ == "__main__":
@@ -1,17 +1,32 @@
 """
 Docusaurus markdown generator for translated posts.
 """
+import asyncio
 import os
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from translator import translate_german_to_english
-from word_parser import parse_text_to_vocabulary, vocabulary_to_markdown_table
+from word_parser import translate_and_parse, vocabulary_to_markdown_table
 
 
 # Path to Docusaurus docs folder
 DOCS_PATH = Path(__file__).parent.parent / "docusaurus" / "docs" / "posts"
 
+# Maximum number of posts translated concurrently
+MAX_CONCURRENT_POSTS = 8
+
+# Maximum number of posts pulled from the feed but not yet saved
+MAX_POSTS_IN_FLIGHT = 2 * MAX_CONCURRENT_POSTS
+
+# Number of latest posts linked from the index page
+INDEX_POST_COUNT = 10
+
+# Precompiled patterns used by sanitize_filename
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'[\s]+')
+
 
 def sanitize_filename(text: str, max_length: int = 50) -> str:
     """
@@ -25,28 +40,29 @@ def sanitize_filename(text: str, max_length: int = 50) -> str:
         Safe filename string
     """
     # Remove special characters
-    safe = re.sub(r'[^\w\s-]', '', text.lower())
+    safe = _NONWORD_RE.sub('', text.lower())
     # Replace whitespace with hyphens
-    safe = re.sub(r'[\s]+', '-', safe)
+    safe = _WS_RE.sub('-', safe)
     # Truncate
     return safe[:max_length].strip('-')
 
 
-def generate_post_markdown(post: dict) -> str:
+def _parse_created(post: dict) -> tuple[datetime | None, str, str]:
     """
-    Generate Docusaurus markdown for a single post.
+    Parse a post's creation date once and cache the result on the post.
 
     Args:
-        post: Post dictionary with text, created_at, uri, author
+        post: Post dictionary
 
     Returns:
-        Markdown string
+        Tuple of (datetime or None if unparseable, display date, ISO date)
     """
-    german_text = post.get("text", "")
-    created_at = post.get("created_at", "")
-    uri = post.get("uri", "")
+    cached = post.get("_dt_cache")
+    if cached:
+        return cached
 
-    # Parse date
+    created_at = post.get("created_at", "")
+    dt = None
     if created_at:
         try:
             dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
@@ -59,17 +75,56 @@ def generate_post_markdown(post: dict) -> str:
         date_str = "Unknown date"
         date_iso = datetime.now().strftime("%Y-%m-%d")
 
-    # Translate the full text
-    english_text = translate_german_to_english(german_text)
+    post["_dt_cache"] = (dt, date_str, date_iso)
+    return post["_dt_cache"]
+
+
+def _post_filename(post: dict) -> str:
+    """
+    Build a post's doc filename (without extension) once and cache it on the post.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Filename stem made of the date and a slug of the text
+    """
+    cached = post.get("_filename")
+    if cached:
+        return cached
+
+    # Create filename from date and content
+    _, _, date_prefix = _parse_created(post)
+    text_slug = sanitize_filename(post.get("text", "post")[:30])
+
+    post["_filename"] = f"{date_prefix}-{text_slug}"
+    return post["_filename"]
+
+
+def generate_post_markdown(post: dict) -> str:
+    """
+    Generate Docusaurus markdown for a single post.
+
+    Args:
+        post: Post dictionary with text, created_at, uri, author
+
+    Returns:
+        Markdown string
+    """
+    german_text = post.get("text", "")
+    uri = post.get("uri", "")
+
+    # Parse date
+    _, date_str, date_iso = _parse_created(post)
 
-    # Parse vocabulary
-    vocabulary = parse_text_to_vocabulary(german_text, include_stopwords=True)
+    # Translate the full text and parse vocabulary in one request
+    english_text, vocabulary = translate_and_parse(german_text, include_stopwords=True)
     vocab_table = vocabulary_to_markdown_table(vocabulary)
 
     # Generate title from first words
-    title_words = german_text.split()[:6]
-    title = " ".join(title_words)
-    if len(german_text.split()) > 6:
+    tokens = german_text.split()
+    title = " ".join(tokens[:6])
+    if len(tokens) > 6:
         title += "..."
 
     # Build markdown
@@ -101,38 +156,24 @@ tags: [der-spiegel, german, translation]
     return markdown
 
 
-def save_post_as_doc(post: dict) -> str:
+def render_post_doc(post: dict) -> tuple[Path, str]:
     """
-    Generate and save a post as a Docusaurus markdown file.
+    Generate a post's Docusaurus markdown and its target path.
 
     Args:
         post: Post dictionary
 
     Returns:
-        Path to saved file
+        Tuple of (file path, markdown string)
     """
-    # Ensure docs directory exists
-    DOCS_PATH.mkdir(parents=True, exist_ok=True)
-
     # Generate markdown
     markdown = generate_post_markdown(post)
 
-    # Create filename from date and content
-    created_at = post.get("created_at", "")
-    if created_at:
-        try:
-            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            date_prefix = dt.strftime("%Y-%m-%d")
-        except Exception:
-            date_prefix = datetime.now().strftime("%Y-%m-%d")
-    else:
-        date_prefix = datetime.now().strftime("%Y-%m-%d")
+    return DOCS_PATH / f"{_post_filename(post)}.md", markdown
 
-    text_slug = sanitize_filename(post.get("text", "post")[:30])
-    filename = f"{date_prefix}-{text_slug}.md"
-    filepath = DOCS_PATH / filename
 
-    # Write file
+def _write_doc(filepath: Path, markdown: str) -> str:
+    """Write a rendered markdown file and return its path."""
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(markdown)
 
@@ -140,6 +181,22 @@ def save_post_as_doc(post: dict) -> str:
     return str(filepath)
 
 
+def save_post_as_doc(post: dict) -> str:
+    """
+    Generate and save a post as a Docusaurus markdown file.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Path to saved file
+    """
+    # Ensure docs directory exists
+    DOCS_PATH.mkdir(parents=True, exist_ok=True)
+
+    return _write_doc(*render_post_doc(post))
+
+
 def generate_index_page(posts: list[dict]) -> None:
     """
     Generate an index page for all posts.
@@ -149,7 +206,7 @@ def generate_index_page(posts: list[dict]) -> None:
     """
     DOCS_PATH.mkdir(parents=True, exist_ok=True)
 
-    content = """---
+    parts = ["""---
 sidebar_position: 1
 ---
 
@@ -158,31 +215,18 @@ sidebar_position: 1
 Welcome to the Der Spiegel Bluesky translation archive. This site automatically fetches posts from Der Spiegel's Bluesky account, translates them to English, and provides word-by-word vocabulary tables for German learners.
 
 ## Latest Posts
-
-"""
+"""]
     # Add links to recent posts
-    for post in posts[:10]:
-        created_at = post.get("created_at", "")
+    for post in posts[:INDEX_POST_COUNT]:
         text = post.get("text", "")[:60] + "..."
 
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d")
-                date_prefix = date_str
-            except Exception:
-                date_str = "Unknown"
-                date_prefix = datetime.now().strftime("%Y-%m-%d")
-        else:
-            date_str = "Unknown"
-            date_prefix = datetime.now().strftime("%Y-%m-%d")
-
-        text_slug = sanitize_filename(text[:30])
-        filename = f"{date_prefix}-{text_slug}"
+        dt, _, date_iso = _parse_created(post)
+        date_str = date_iso if dt else "Unknown"
+        filename = _post_filename(post)
 
-        content += f"- [{date_str}] [{text}](./{filename})\n"
+        parts.append(f"- [{date_str}] [{text}](./{filename})")
 
-    content += """
+    parts.append("""
 
 ## How to Use This Site
 
@@ -198,38 +242,119 @@ This documentation is automatically generated by a Python crawler that:
 - Creates word-by-word vocabulary breakdowns
 
 Happy learning! 🇩🇪 → 🇬🇧
-"""
+""")
 
     index_path = DOCS_PATH / "intro.md"
     with open(index_path, "w", encoding="utf-8") as f:
-        f.write(content)
+        f.write("\n".join(parts))
 
     print(f"Generated index: {index_path}")
 
 
-def process_posts(posts: list[dict]) -> list[str]:
+async def save_post_as_doc_async(post: dict, semaphore: asyncio.Semaphore) -> str | None:
     """
-    Process multiple posts and save them as Docusaurus docs.
+    Save a post using worker threads.
+
+    Only rendering (which translates) holds the shared semaphore; the
+    file is written after the slot is released, so disk writes overlap
+    with the next post's translation.
 
     Args:
-        posts: List of post dictionaries
+        post: Post dictionary
+        semaphore: Semaphore capping concurrent translations
 
     Returns:
-        List of saved file paths
+        Path to saved file, or None if processing failed
     """
+    try:
+        async with semaphore:
+            filepath, markdown = await asyncio.to_thread(render_post_doc, post)
+        return await asyncio.to_thread(_write_doc, filepath, markdown)
+    except Exception as e:
+        print(f"Error processing post: {e}")
+        return None
+
+
+async def process_posts_async(posts: Iterable[dict]) -> tuple[list[str], int]:
+    """
+    Process multiple posts concurrently and save them as Docusaurus docs.
+
+    Posts may come from a generator: each post starts processing as soon
+    as it is yielded, while the generator keeps producing the next ones.
+    At most MAX_POSTS_IN_FLIGHT posts are held at a time, and only the
+    first INDEX_POST_COUNT are kept for the index page.
+
+    Args:
+        posts: Iterable of post dictionaries
+
+    Returns:
+        Tuple of (list of saved file paths, number of posts processed)
+    """
+    # Ensure docs directory exists
+    DOCS_PATH.mkdir(parents=True, exist_ok=True)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+    in_flight = asyncio.Semaphore(MAX_POSTS_IN_FLIGHT)
+    loop = asyncio.get_running_loop()
+    index_posts = []
     saved_files = []
-    for post in posts:
+    pending = set()
+    post_count = 0
+
+    async def process(post: dict) -> None:
+        try:
+            filepath = await save_post_as_doc_async(post, semaphore)
+            if filepath:
+                saved_files.append(filepath)
+        finally:
+            in_flight.release()
+
+    # Advance the iterator on a single dedicated thread, so a generator that
+    # blocks on the network (and holds thread-bound resources) never runs on
+    # the event loop or hops between threads
+    iterator = iter(posts)
+    with ThreadPoolExecutor(max_workers=1) as feed_executor:
         try:
-            filepath = save_post_as_doc(post)
-            saved_files.append(filepath)
-        except Exception as e:
-            print(f"Error processing post: {e}")
+            while True:
+                # Wait for a free slot before pulling the next post
+                await in_flight.acquire()
+                post = await loop.run_in_executor(feed_executor, next, iterator, None)
+                if post is None:
+                    in_flight.release()
+                    break
+
+                post_count += 1
+                if len(index_posts) < INDEX_POST_COUNT:
+                    index_posts.append(post)
+
+                task = asyncio.create_task(process(post))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await loop.run_in_executor(feed_executor, close)
+
+    await asyncio.gather(*pending)
 
     # Generate index page
-    if posts:
-        generate_index_page(posts)
+    if index_posts:
+        generate_index_page(index_posts)
+
+    return saved_files, post_count
+
+
+def process_posts(posts: Iterable[dict]) -> tuple[list[str], int]:
+    """
+    Process multiple posts and save them as Docusaurus docs.
+
+    Args:
+        posts: Iterable of post dictionaries, e.g. from iter_spiegel_posts
 
-    return saved_files
+    Returns:
+        Tuple of (list of saved file paths, number of posts processed)
+    """
+    return asyncio.run(process_posts_async(posts))
 
 
 if __name__ == "__main__":
@@ -6,38 +6,49 @@ translates them to English, and generates Docusaurus documentation
 with word-by-word vocabulary tables.
 """
 import argparse
-from bluesky_client import fetch_spiegel_posts, fetch_new_posts
+from bluesky_client import iter_spiegel_posts, iter_new_posts
 from doc_generator import process_posts, save_post_as_doc
+from translator import flush_translation_cache
 
 
-def run_crawl(limit: int = 50, new_only: bool = True):
+def run_crawl(limit: int = 50, new_only: bool = True) -> list[str]:
     """
     Run the crawler and generate documentation.
 
     Args:
         limit: Maximum number of posts to fetch
         new_only: Only fetch posts not previously processed
+
+    Returns:
+        List of generated documentation file paths
     """
     print("Der Spiegel Bluesky Crawler")
     print("=" * 40)
 
-    # Fetch posts
+    # Fetch posts; they are processed as they arrive
     if new_only:
         print("\nFetching new posts...")
-        posts = fetch_new_posts()
+        posts = iter_new_posts()
     else:
         print(f"\nFetching up to {limit} posts...")
-        posts = fetch_spiegel_posts(limit=limit)
-
-    if not posts:
-        print("No new posts found.")
-        return
-
-    print(f"Found {len(posts)} posts to process")
+        posts = iter_spiegel_posts(limit=limit)
 
     # Process and generate docs
     print("\nProcessing posts and generating documentation...")
-    saved_files = process_posts(posts)
+    try:
+        saved_files, post_count = process_posts(posts)
+    finally:
+        # Persist new translations now, not only at interpreter exit, so a
+        # long-running scheduler that gets killed keeps what it learned
+        flush_translation_cache()
+
+    if not post_count:
+        print("No new posts found.")
+        return []
+
+    failed = post_count - len(saved_files)
+    if failed:
+        print(f"\nFailed to process {failed} of {post_count} posts.")
 
     print(f"\n{'=' * 40}")
     print(f"Completed! Generated {len(saved_files)} documentation files.")
@@ -45,6 +56,8 @@ def run_crawl(limit: int = 50, new_only: bool = True):
     print("  cd docusaurus")
     print("  npm start")
 
+    return saved_files
+
 
 def main():
     """Main entry point with CLI arguments."""
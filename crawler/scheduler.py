@@ -2,14 +2,31 @@
 Scheduler for daily crawling of Der Spiegel Bluesky posts.
 """
 import schedule
+import shutil
 import time
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_crawler():
-    """Run the main crawler script."""
+# npm executable, resolved once (npm.cmd on Windows)
+_NPM = shutil.which("npm") or shutil.which("npm.cmd")
+
+
+# Seconds to wait for a still-running build before starting the next one
+BUILD_TIMEOUT = 30 * 60
+
+# Handle of the background Docusaurus build, if one was started
+_build_process = None
+
+
+def run_crawler() -> bool:
+    """
+    Run the main crawler script.
+
+    Returns:
+        True if new documentation files were generated
+    """
     print(f"\n{'='*50}")
     print(f"Running crawler at {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print('='*50)
@@ -17,39 +34,86 @@ def run_crawler():
     try:
         # Import and run the main crawler
         from main import run_crawl
-        run_crawl()
+        saved_files = run_crawl()
         print("Crawler completed successfully!")
+        return bool(saved_files)
     except Exception as e:
         print(f"Crawler error: {e}")
+        return False
+
+
+def poll_build() -> bool:
+    """
+    Check on the background Docusaurus build and report when it finishes.
+
+    Returns:
+        True if a build is still running
+    """
+    global _build_process
+    if _build_process is None:
+        return False
+    returncode = _build_process.poll()
+    if returncode is None:
+        return True
+
+    if returncode == 0:
+        print("Docusaurus build completed!")
+    else:
+        print(f"Docusaurus build failed with exit code {returncode}")
+    _build_process = None
+    return False
+
+
+def wait_for_build(timeout: float | None = None) -> None:
+    """
+    Wait for the background Docusaurus build to finish.
+
+    Args:
+        timeout: Seconds to wait before killing the build (None waits forever)
+    """
+    if _build_process is None:
+        return
+    try:
+        _build_process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print("Previous Docusaurus build timed out, stopping it")
+        _build_process.kill()
+        _build_process.wait()
+    poll_build()
 
 
 def rebuild_docusaurus():
-    """Rebuild the Docusaurus site after crawling."""
+    """Start a background rebuild of the Docusaurus site after crawling."""
+    global _build_process
     docusaurus_path = Path(__file__).parent.parent / "docusaurus"
 
     if not docusaurus_path.exists():
         print("Docusaurus directory not found, skipping build")
         return
 
-    print("Rebuilding Docusaurus site...")
+    if _NPM is None:
+        print("npm not found, skipping Docusaurus build")
+        return
+
+    # Don't overlap with a build left over from the previous run
+    wait_for_build(timeout=BUILD_TIMEOUT)
+
+    print("Rebuilding Docusaurus site in the background...")
     try:
-        subprocess.run(
-            ["npm", "run", "build"],
-            cwd=str(docusaurus_path),
-            check=True,
-            shell=True
+        _build_process = subprocess.Popen(
+            [_NPM, "run", "build"],
+            cwd=str(docusaurus_path)
         )
-        print("Docusaurus build completed!")
-    except subprocess.CalledProcessError as e:
-        print(f"Docusaurus build failed: {e}")
     except FileNotFoundError:
         print("npm not found, skipping Docusaurus build")
 
 
 def daily_job():
     """Run the full daily job: crawl + rebuild."""
-    run_crawler()
-    rebuild_docusaurus()
+    if run_crawler():
+        rebuild_docusaurus()
+    else:
+        print("No new documentation, skipping Docusaurus build")
 
 
 def start_scheduler(run_time: str = "06:00"):
@@ -72,6 +136,7 @@ def start_scheduler(run_time: str = "06:00"):
     # Keep the scheduler running
     while True:
         schedule.run_pending()
+        poll_build()
         time.sleep(60)  # Check every minute
 
 
@@ -96,5 +161,6 @@ if __name__ == "__main__":
     if args.once:
         print("Running single crawl...")
         daily_job()
+        wait_for_build()
     else:
         start_scheduler(args.time)
@@ -1,16 +1,129 @@
 """
 Translation module using deep-translator for German to English translation.
 """
-from deep_translator import GoogleTranslator
+import atexit
+import random
+import threading
 import time
+from pathlib import Path
+import orjson
+from deep_translator import GoogleTranslator
+
+
+# Separator used to pack several words into one translation request.
+# A bullet on its own line survives translation unchanged.
+BULK_DELIMITER = "\n•\n"
+
+# File to persist translations between runs (next to fetched_posts.sqlite)
+TRANSLATION_CACHE_FILE = Path(__file__).parent / "translation_cache.json"
+
+# Rate limit for translation API requests
+REQUESTS_PER_SECOND = 8
+REQUEST_BURST = 16
+
+# Retries for failed translation requests, with exponential backoff
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rps: float, burst: int):
+        self.rps = rps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rps)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rps
+            time.sleep(wait)
 
 
 class GermanTranslator:
     """Translator for German to English using Google Translate (free)."""
 
-    def __init__(self):
-        self.translator = GoogleTranslator(source='de', target='en')
-        self._cache = {}  # Cache translations to avoid repeated API calls
+    def __init__(self, source: str = 'de', target: str = 'en'):
+        self.source = source
+        self.target = target
+        self._local = threading.local()
+        self._bucket = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+        self._cache = self._load()  # Word translations, persisted between runs
+        self._text_cache = {}  # Full-text translations, kept in memory only
+        self._dirty = False
+
+    @property
+    def translator(self) -> GoogleTranslator:
+        """Per-thread GoogleTranslator, since it mutates request state on each call."""
+        translator = getattr(self._local, "translator", None)
+        if translator is None:
+            translator = GoogleTranslator(source=self.source, target=self.target)
+            self._local.translator = translator
+        return translator
+
+    def _request(self, text: str) -> str:
+        """
+        Send a translation request, rate limited and retried on failure.
+
+        Args:
+            text: Text to translate
+
+        Returns:
+            Translated text
+
+        Raises:
+            Exception: The last error if all retries fail
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            self._bucket.acquire()
+            try:
+                return self.translator.translate(text)
+            except Exception:
+                if attempt == MAX_RETRIES:
+                    raise
+                # Exponential backoff with full jitter
+                time.sleep(random.uniform(0, BACKOFF_BASE * 2 ** attempt))
+
+    def _key(self, text: str) -> str:
+        """Build the cache key for a text in this language pair."""
+        return f"{self.source}:{self.target}:{text}"
+
+    def _remember(self, text: str, translation: str) -> None:
+        """Store a word translation in the persisted cache."""
+        self._cache[self._key(text)] = translation
+        self._dirty = True
+
+    def _remember_text(self, text: str, translation: str) -> None:
+        """Store a full-text translation in the in-memory cache."""
+        self._text_cache[self._key(text)] = translation
+
+    def _load(self) -> dict[str, str]:
+        """Load persisted translations from disk."""
+        if TRANSLATION_CACHE_FILE.exists():
+            try:
+                with open(TRANSLATION_CACHE_FILE, "rb") as f:
+                    return orjson.loads(f.read())
+            except (OSError, ValueError) as e:
+                print(f"Could not load translation cache: {e}")
+        return {}
+
+    def flush(self) -> None:
+        """Write the word translation cache to disk if it changed."""
+        if not self._dirty:
+            return
+        with open(TRANSLATION_CACHE_FILE, "wb") as f:
+            f.write(orjson.dumps(self._cache))
+        self._dirty = False
 
     def translate_text(self, text: str) -> str:
         """
@@ -26,12 +139,13 @@ class GermanTranslator:
             return ""
 
         # Check cache first
-        if text in self._cache:
-            return self._cache[text]
+        key = self._key(text)
+        if key in self._text_cache:
+            return self._text_cache[key]
 
         try:
-            translation = self.translator.translate(text)
-            self._cache[text] = translation
+            translation = self._request(text)
+            self._remember_text(text, translation)
             return translation
         except Exception as e:
             print(f"Translation error: {e}")
@@ -54,14 +168,13 @@ class GermanTranslator:
         clean_word = word.strip().lower()
 
         # Check cache
-        if clean_word in self._cache:
-            return self._cache[clean_word]
+        key = self._key(clean_word)
+        if key in self._cache:
+            return self._cache[key]
 
         try:
-            # Add small delay to avoid rate limiting
-            time.sleep(0.1)
-            translation = self.translator.translate(clean_word)
-            self._cache[clean_word] = translation
+            translation = self._request(clean_word)
+            self._remember(clean_word, translation)
             return translation
         except Exception as e:
             print(f"Word translation error for '{word}': {e}")
@@ -83,19 +196,144 @@ class GermanTranslator:
                 translations[word] = self.translate_word(word)
         return translations
 
+    def _request_segments(self, segments: list[str]) -> list[str] | None:
+        """
+        Translate several segments with a single API request.
+
+        Args:
+            segments: Texts to translate, none containing the delimiter
+
+        Returns:
+            One translation per segment, or None if the response could not
+            be split back into the segments
+
+        Raises:
+            Exception: If the request fails after all retries
+        """
+        joined = self._request(BULK_DELIMITER.join(segments))
+        parts = [part.strip() for part in (joined or "").split("•")]
+        return parts if len(parts) == len(segments) else None
+
+    def _remember_words(self, clean_words: list[str], translations: list[str]) -> None:
+        """Cache word translations, skipping empty reply segments."""
+        for clean_word, translation in zip(clean_words, translations):
+            if translation:
+                self._remember(clean_word, translation)
+
+    def _word_misses(self, words: list[str]) -> list[str]:
+        """Return the unique cleaned words that are not cached yet."""
+        return list(dict.fromkeys(
+            clean_word for clean_word in (word.strip().lower() for word in words)
+            if self._key(clean_word) not in self._cache
+        ))
+
+    def _cached_words(self, words: list[str]) -> dict[str, str]:
+        """Map words to their cached translations, or to themselves."""
+        return {
+            word: self._cache.get(self._key(word.strip().lower()), word)
+            for word in words
+        }
+
+    def translate_words_bulk(self, words: list[str]) -> dict[str, str]:
+        """
+        Translate multiple words with a single API request.
+
+        Cached words are served from the cache; all remaining words are
+        joined with BULK_DELIMITER and translated in one round-trip. If the
+        response cannot be split back into one translation per word, the
+        misses fall back to per-word translation. If the request itself
+        fails, uncached words map to themselves.
+
+        Args:
+            words: List of German words
+
+        Returns:
+            Dictionary mapping German words to English translations
+        """
+        words = [word for word in words if word and word.strip()]
+        misses = self._word_misses(words)
+
+        if misses:
+            try:
+                parts = self._request_segments(misses)
+            except Exception as e:
+                print(f"Bulk translation error: {e}")
+                return self._cached_words(words)
+
+            if parts is not None:
+                self._remember_words(misses, parts)
+            else:
+                for clean_word in misses:
+                    self.translate_word(clean_word)
+
+        return self._cached_words(words)
+
+    def translate_post(self, text: str, words: list[str]) -> tuple[str, dict[str, str]]:
+        """
+        Translate a full text and its words with a single API request.
+
+        The text is sent as the first segment, followed by the words that
+        are not cached yet. If the text itself contains the delimiter or
+        the response cannot be split, the text and words are translated
+        separately instead. If the request fails, no further requests are
+        made and the usual failure placeholders are returned.
+
+        Args:
+            text: German text to translate
+            words: List of German words from the text
+
+        Returns:
+            Tuple of (English translation, dictionary mapping German words
+            to English translations)
+        """
+        words = [word for word in words if word and word.strip()]
+        if not text or not text.strip() or self._key(text) in self._text_cache or "•" in text:
+            return self.translate_text(text), self.translate_words_bulk(words)
+
+        misses = self._word_misses(words)
+        try:
+            parts = self._request_segments([text] + misses)
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return f"[Translation failed: {text}]", self._cached_words(words)
+
+        if parts is None:
+            return self.translate_text(text), self.translate_words_bulk(words)
+
+        self._remember_text(text, parts[0])
+        self._remember_words(misses, parts[1:])
+        return parts[0], self._cached_words(words)
+
 
 # Global translator instance
 _translator = None
 
+# Guards creation of the global instance; post workers call get_translator
+# concurrently and __init__ reads the cache file
+_translator_lock = threading.Lock()
+
 
 def get_translator() -> GermanTranslator:
     """Get or create the global translator instance."""
     global _translator
     if _translator is None:
-        _translator = GermanTranslator()
+        with _translator_lock:
+            if _translator is None:
+                _translator = GermanTranslator()
     return _translator
 
 
+def flush_translation_cache() -> None:
+    """Persist the global translator's word cache, if it was created."""
+    if _translator is not None:
+        _translator.flush()
+
+
+# Flush the singleton once at exit; flush() replaces the file wholesale, so
+# only the single global instance may write it
+atexit.register(flush_translation_cache)
+
+
 def translate_german_to_english(text: str) -> str:
     """
     Convenience function to translate German text to English.
@@ -6,8 +6,14 @@ from dataclasses import dataclass
 from translator import get_translator
 
 
-# Common German stopwords to optionally filter out
-GERMAN_STOPWORDS = {
+# Precompiled patterns used by the tokenizer
+_URL_RE = re.compile(r'https?://\S+')
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@\w+')
+_WORD_RE = re.compile(r'\b[a-zA-ZäöüÄÖÜß]+\b')
+
+# Common German stopwords to optionally filter out (lowercase)
+GERMAN_STOPWORDS = frozenset({
     "der", "die", "das", "den", "dem", "des",
     "ein", "eine", "einer", "einem", "einen", "eines",
     "und", "oder", "aber", "doch", "jedoch",
@@ -20,10 +26,38 @@ GERMAN_STOPWORDS = {
     "als", "wenn", "weil", "dass", "ob",
     "auch", "noch", "schon", "nur", "sehr", "so", "wie",
     "für", "über", "unter", "vor", "hinter", "neben", "zwischen",
+})
+
+# Grammatical notes for closed word classes, checked in this order
+_WORD_CATEGORIES = [
+    # Articles
+    ("definite article", {"der", "die", "das", "den", "dem", "des"}),
+    ("indefinite article", {"ein", "eine", "einer", "einem", "einen", "eines"}),
+    # Pronouns
+    ("personal pronoun", {"ich", "du", "er", "sie", "es", "wir", "ihr"}),
+    ("possessive pronoun", {"mein", "dein", "sein", "ihr", "unser", "euer"}),
+    # Common verbs
+    ("verb (sein - to be)", {"ist", "sind", "war", "waren"}),
+    ("verb (haben - to have)", {"hat", "haben", "hatte", "hatten"}),
+    ("verb (werden - to become)", {"wird", "werden", "wurde", "wurden"}),
+    # Prepositions
+    ("preposition", {"in", "im", "an", "am", "auf", "aus", "bei", "mit", "nach", "von", "zu", "zum", "zur",
+                     "für", "über", "unter", "vor", "hinter", "neben", "zwischen"}),
+    # Conjunctions
+    ("conjunction", {"und", "oder", "aber", "doch", "jedoch", "weil", "dass", "ob", "wenn", "als"}),
+    # Negation
+    ("negation", {"nicht", "kein", "keine", "keiner", "keinem", "keinen"}),
+]
+
+# Word -> notes lookup; built in reverse so the first matching category wins
+_NOTES_BY_WORD = {
+    word: notes
+    for notes, words in reversed(_WORD_CATEGORIES)
+    for word in words
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WordEntry:
     """Represents a German word with its translation."""
     german: str
@@ -38,6 +72,26 @@ class WordEntry:
         }
 
 
+def _strip_markup(text: str) -> str:
+    """Remove URLs and mentions, and unwrap hashtags, before tokenizing."""
+    # Each pass is skipped when its marker is absent; the substring check
+    # is much cheaper than a regex scan over the whole post.
+
+    # Remove URLs
+    if '://' in text:
+        text = _URL_RE.sub('', text)
+
+    # Remove hashtags but keep the word
+    if '#' in text:
+        text = _HASHTAG_RE.sub(r'\1', text)
+
+    # Remove mentions
+    if '@' in text:
+        text = _MENTION_RE.sub('', text)
+
+    return text
+
+
 def tokenize_german_text(text: str) -> list[str]:
     """
     Tokenize German text into individual words.
@@ -48,19 +102,8 @@ def tokenize_german_text(text: str) -> list[str]:
     Returns:
         List of words
     """
-    # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-
-    # Remove hashtags but keep the word
-    text = re.sub(r'#(\w+)', r'\1', text)
-
-    # Remove mentions
-    text = re.sub(r'@\w+', '', text)
-
     # Split on whitespace and punctuation, keeping words
-    words = re.findall(r'\b[a-zA-ZäöüÄÖÜß]+\b', text)
-
-    return words
+    return _WORD_RE.findall(_strip_markup(text))
 
 
 def extract_unique_words(text: str, include_stopwords: bool = True) -> list[str]:
@@ -74,16 +117,19 @@ def extract_unique_words(text: str, include_stopwords: bool = True) -> list[str]
     Returns:
         List of unique words (preserving first occurrence order)
     """
-    words = tokenize_german_text(text)
     seen = set()
     unique_words = []
 
-    for word in words:
+    # Tokenize and deduplicate in a single pass over the matches
+    for match in _WORD_RE.finditer(_strip_markup(text)):
+        word = match.group()
         word_lower = word.lower()
-        if word_lower not in seen:
-            if include_stopwords or word_lower not in GERMAN_STOPWORDS:
-                seen.add(word_lower)
-                unique_words.append(word)
+        if word_lower in seen:
+            continue
+        if not include_stopwords and word_lower in GERMAN_STOPWORDS:
+            continue
+        seen.add(word_lower)
+        unique_words.append(word)
 
     return unique_words
 
@@ -100,39 +146,10 @@ def get_word_notes(word: str) -> str:
     """
     word_lower = word.lower()
 
-    # Articles
-    if word_lower in {"der", "die", "das", "den", "dem", "des"}:
-        return "definite article"
-    if word_lower in {"ein", "eine", "einer", "einem", "einen", "eines"}:
-        return "indefinite article"
-
-    # Pronouns
-    if word_lower in {"ich", "du", "er", "sie", "es", "wir", "ihr"}:
-        return "personal pronoun"
-    if word_lower in {"mein", "dein", "sein", "ihr", "unser", "euer"}:
-        return "possessive pronoun"
-
-    # Common verbs
-    if word_lower in {"ist", "sind", "war", "waren"}:
-        return "verb (sein - to be)"
-    if word_lower in {"hat", "haben", "hatte", "hatten"}:
-        return "verb (haben - to have)"
-    if word_lower in {"wird", "werden", "wurde", "wurden"}:
-        return "verb (werden - to become)"
-
-    # Prepositions
-    prepositions = {"in", "im", "an", "am", "auf", "aus", "bei", "mit", "nach", "von", "zu", "zum", "zur",
-                    "für", "über", "unter", "vor", "hinter", "neben", "zwischen"}
-    if word_lower in prepositions:
-        return "preposition"
-
-    # Conjunctions
-    if word_lower in {"und", "oder", "aber", "doch", "jedoch", "weil", "dass", "ob", "wenn", "als"}:
-        return "conjunction"
-
-    # Negation
-    if word_lower in {"nicht", "kein", "keine", "keiner", "keinem", "keinen"}:
-        return "negation"
+    # Closed word classes
+    notes = _NOTES_BY_WORD.get(word_lower)
+    if notes:
+        return notes
 
     # Check for common noun patterns
     if word[0].isupper() and len(word) > 1:
@@ -149,6 +166,17 @@ def get_word_notes(word: str) -> str:
     return ""
 
 
+def _build_vocabulary(words: list[str], trans_map: dict[str, str]) -> list[WordEntry]:
+    """Create vocabulary entries from words and their translations."""
+    vocabulary = []
+    for word in words:
+        english = trans_map.get(word, word)
+        notes = get_word_notes(word)
+        vocabulary.append(WordEntry(german=word, english=english, notes=notes))
+
+    return vocabulary
+
+
 def parse_text_to_vocabulary(text: str, include_stopwords: bool = True) -> list[WordEntry]:
     """
     Parse German text and create vocabulary entries with translations.
@@ -162,14 +190,27 @@ def parse_text_to_vocabulary(text: str, include_stopwords: bool = True) -> list[
     """
     translator = get_translator()
     words = extract_unique_words(text, include_stopwords)
+    trans_map = translator.translate_words_bulk(words)
+    return _build_vocabulary(words, trans_map)
 
-    vocabulary = []
-    for word in words:
-        english = translator.translate_word(word)
-        notes = get_word_notes(word)
-        vocabulary.append(WordEntry(german=word, english=english, notes=notes))
 
-    return vocabulary
+def translate_and_parse(text: str, include_stopwords: bool = True) -> tuple[str, list[WordEntry]]:
+    """
+    Translate German text and create its vocabulary entries together.
+
+    The full text and its words share one translation request.
+
+    Args:
+        text: German text to translate and parse
+        include_stopwords: Whether to include common stopwords
+
+    Returns:
+        Tuple of (English translation, list of WordEntry objects)
+    """
+    translator = get_translator()
+    words = extract_unique_words(text, include_stopwords)
+    english_text, trans_map = translator.translate_post(text, words)
+    return english_text, _build_vocabulary(words, trans_map)
 
 
 def vocabulary_to_markdown_table(vocabulary: list[WordEntry]) -> str: